@@ -34,6 +34,7 @@ def train_one_epoch(
     num_training_steps_per_epoch=None,
     update_freq=None,
     use_amp=False,
+    channels_last=False,
 ):
     model.train(True)
     metric_logger = utils.MetricLogger(delimiter="  ")
@@ -45,6 +46,7 @@ def train_one_epoch(
     print_freq = 10
 
     optimizer.zero_grad()
+    memory_format = torch.channels_last if channels_last else torch.preserve_format
 
     for data_iter_step, (samples, targets) in enumerate(
         metric_logger.log_every(data_loader, print_freq, header)
@@ -65,7 +67,7 @@ def train_one_epoch(
                 if wd_schedule_values is not None and param_group["weight_decay"] > 0:
                     param_group["weight_decay"] = wd_schedule_values[it]
 
-        samples = samples.to(device, non_blocking=True)
+        samples = samples.to(device, non_blocking=True, memory_format=memory_format)
         targets = targets.to(device, non_blocking=True)
 
         if mixup_fn is not None:
@@ -172,8 +174,9 @@ def train_one_epoch(
 
 
 @torch.no_grad()
-def evaluate(data_loader, model, device, use_amp=False):
+def evaluate(data_loader, model, device, use_amp=False, channels_last=False):
     criterion = torch.nn.CrossEntropyLoss()
+    memory_format = torch.channels_last if channels_last else torch.preserve_format
 
     metric_logger = utils.MetricLogger(delimiter="  ")
     header = "Test:"
@@ -184,7 +187,7 @@ def evaluate(data_loader, model, device, use_amp=False):
         images = batch[0]
         target = batch[-1]
 
-        images = images.to(device, non_blocking=True)
+        images = images.to(device, non_blocking=True, memory_format=memory_format)
         target = target.to(device, non_blocking=True)
 
         # compute output
@@ -19,7 +19,7 @@ import os
 from pathlib import Path
 
 from timm.data.mixup import Mixup
-from timm.models import create_model
+from timm.models import create_model, is_model_in_modules
 from timm.loss import LabelSmoothingCrossEntropy, SoftTargetCrossEntropy
 from timm.utils import ModelEma
 from optim_factory import create_optimizer, LayerDecayValueAssigner
@@ -355,6 +355,38 @@ def get_args_parser():
         default=False,
         help="Use PyTorch's AMP (Automatic Mixed Precision) or not",
     )
+    parser.add_argument(
+        "--use_bf16",
+        type=str2bool,
+        default=False,
+        help="Run ortho ConvNeXt models under bfloat16 autocast. With --use_amp, "
+        "the model's bf16 autocast overrides the fp16 one, but the fp16 "
+        "GradScaler still runs (harmless, not needed for bf16)",
+    )
+    parser.add_argument(
+        "--cuda_graph",
+        type=str2bool,
+        default=False,
+        help="Replay the eval-only forward pass from a captured CUDA graph",
+    )
+    parser.add_argument(
+        "--channels_last",
+        type=str2bool,
+        default=False,
+        help="Use channels_last memory format for model weights and input batches",
+    )
+    parser.add_argument(
+        "--compile",
+        type=str2bool,
+        default=False,
+        help="Compile the model with torch.compile (requires PyTorch>=2.2)",
+    )
+    parser.add_argument(
+        "--int8_eval",
+        type=str2bool,
+        default=False,
+        help="Evaluate with dynamically int8-quantized Linear layers (CPU only)",
+    )
 
     # Weights and Biases arguments
     parser.add_argument(
@@ -388,6 +420,24 @@ def get_args_parser():
 def main(args):
     utils.init_distributed_mode(args)
     print(args)
+    if args.use_bf16:
+        assert is_model_in_modules(
+            args.model, ["ortho_convnext"]
+        ), "--use_bf16 is only implemented by the models in models/ortho_convnext.py"
+        if args.use_amp:
+            print("Warning: --use_bf16 overrides the fp16 autocast of --use_amp")
+    assert args.eval or not args.cuda_graph, "--cuda_graph requires --eval"
+    assert args.eval or not args.int8_eval, "--int8_eval requires --eval"
+    assert (
+        args.device == "cpu" or not args.int8_eval
+    ), "--int8_eval requires --device cpu"
+    assert not (
+        args.int8_eval and args.cuda_graph
+    ), "--int8_eval runs on CPU and --cuda_graph on CUDA; pick one"
+    # quantize_dynamic's deepcopy keeps compile()'s callable bound to the fp32 model
+    assert not (
+        args.int8_eval and args.compile
+    ), "--int8_eval cannot be combined with --compile"
     device = torch.device(args.device)
 
     # fix the seed for reproducibility
@@ -475,6 +525,7 @@ def main(args):
             num_classes=args.nb_classes,
         )
 
+    model_kwargs = {"use_bf16": True} if args.use_bf16 else {}
     model = create_model(
         args.model,
         pretrained=False,
@@ -482,6 +533,7 @@ def main(args):
         drop_path_rate=args.drop_path,
         layer_scale_init_value=args.layer_scale_init_value,
         head_init_scale=args.head_init_scale,
+        **model_kwargs,
     )
 
     if args.finetune:
@@ -510,6 +562,8 @@ def main(args):
                 print(f"Removing key {k} from pretrained checkpoint")
                 del checkpoint_model[k]
         utils.load_state_dict(model, checkpoint_model, prefix=args.model_prefix)
+    if args.channels_last:
+        model.to(memory_format=torch.channels_last)
     model.to(device)
 
     model_ema = None
@@ -523,6 +577,12 @@ def main(args):
         )
         print("Using EMA with decay = %.8f" % args.model_ema_decay)
 
+    if args.compile:
+        # in-place compile keeps state_dict keys unchanged for checkpoints and EMA;
+        # Inductor fuses the Block's elementwise ops (activation, bias, layer
+        # scale) into generated Triton kernels
+        model.compile()
+
     model_without_ddp = model
     n_parameters = sum(p.numel() for p in model.parameters() if p.requires_grad)
 
@@ -616,7 +676,22 @@ def main(args):
 
     if args.eval:
         print(f"Eval only mode")
-        test_stats = evaluate(data_loader_val, model, device, use_amp=args.use_amp)
+        if args.int8_eval:
+            # pwconv1/pwconv2 and the head; per-channel weight scales
+            model = torch.quantization.quantize_dynamic(
+                model_without_ddp,
+                {torch.nn.Linear: torch.quantization.per_channel_dynamic_qconfig},
+                dtype=torch.qint8,
+            )
+        if args.cuda_graph:
+            model = utils.CUDAGraphInference(model)
+        test_stats = evaluate(
+            data_loader_val,
+            model,
+            device,
+            use_amp=args.use_amp,
+            channels_last=args.channels_last,
+        )
         print(
             f"Accuracy of the network on {len(dataset_val)} test images: {test_stats['acc1']:.5f}%"
         )
@@ -654,6 +729,7 @@ def main(args):
             num_training_steps_per_epoch=num_training_steps_per_epoch,
             update_freq=args.update_freq,
             use_amp=args.use_amp,
+            channels_last=args.channels_last,
         )
         if args.output_dir and args.save_ckpt:
             if (epoch + 1) % args.save_ckpt_freq == 0 or epoch + 1 == args.epochs:
@@ -667,7 +743,13 @@ def main(args):
                     model_ema=model_ema,
                 )
         if data_loader_val is not None:
-            test_stats = evaluate(data_loader_val, model, device, use_amp=args.use_amp)
+            test_stats = evaluate(
+                data_loader_val,
+                model,
+                device,
+                use_amp=args.use_amp,
+                channels_last=args.channels_last,
+            )
             print(
                 f"Accuracy of the model on the {len(dataset_val)} test images: {test_stats['acc1']:.1f}%"
             )
@@ -700,7 +782,11 @@ def main(args):
             # repeat testing routines for EMA, if ema eval is turned on
             if args.model_ema and args.model_ema_eval:
                 test_stats_ema = evaluate(
-                    data_loader_val, model_ema.ema, device, use_amp=args.use_amp
+                    data_loader_val,
+                    model_ema.ema,
+                    device,
+                    use_amp=args.use_amp,
+                    channels_last=args.channels_last,
                 )
                 print(
                     f"Accuracy of the model EMA on {len(dataset_val)} test images: {test_stats_ema['acc1']:.1f}%"
@@ -105,7 +105,7 @@ class ConvNeXt(nn.Module):
         self.stages = (
             nn.ModuleList()
         )  # 4 feature resolution stages, each consisting of multiple residual blocks
-        dp_rates = [x.item() for x in torch.linspace(0, drop_path_rate, sum(depths))]
+        dp_rates = torch.linspace(0, drop_path_rate, sum(depths)).tolist()
         cur = 0
         for i in range(4):
             stage = nn.Sequential(
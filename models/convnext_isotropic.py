@@ -44,7 +44,7 @@ class ConvNeXtIsotropic(nn.Module):
         super().__init__()
 
         self.stem = nn.Conv2d(in_chans, dim, kernel_size=16, stride=16)
-        dp_rates = [x.item() for x in torch.linspace(0, drop_path_rate, depth)]
+        dp_rates = torch.linspace(0, drop_path_rate, depth).tolist()
         self.blocks = nn.Sequential(
             *[
                 Block(
@@ -6,15 +6,31 @@
 # LICENSE file in the root directory of this source tree.
 
 
+from typing import Optional
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
-from timm.models.layers import trunc_normal_, DropPath
+from timm.models.layers import trunc_normal_
 from timm.models.registry import register_model
 from functools import partial
 from torchortho import HermiteActivation, FourierActivation, TropicalActivation
 
 
+@torch.jit.script
+def layer_scale_residual(
+    shortcut: torch.Tensor,
+    x: torch.Tensor,
+    gamma: Optional[torch.Tensor],
+    keep_mask: Optional[torch.Tensor],
+) -> torch.Tensor:
+    """shortcut + keep_mask * (gamma * x), fused into a single elementwise kernel."""
+    if gamma is not None:
+        x = gamma * x
+    if keep_mask is not None:
+        x = keep_mask * x
+    return shortcut + x
+
+
 class Block(nn.Module):
     r"""ConvNeXt Block. There are two equivalent implementations:
     (1) DwConv -> LayerNorm (channels_first) -> 1x1 Conv -> GELU -> 1x1 Conv; all in (N, C, H, W)
@@ -36,29 +52,35 @@ class Block(nn.Module):
         self.pwconv1 = nn.Linear(
             dim, 4 * dim
         )  # pointwise/1x1 convs, implemented with linear layers
-        self.act = act()
+        self.act = act if isinstance(act, nn.Module) else act()
         self.pwconv2 = nn.Linear(4 * dim, dim)
         self.gamma = (
             nn.Parameter(layer_scale_init_value * torch.ones((dim)), requires_grad=True)
             if layer_scale_init_value > 0
             else None
         )
-        self.drop_path = DropPath(drop_path) if drop_path > 0.0 else nn.Identity()
+        self.drop_prob = drop_path
 
-    def forward(self, x):
+    def _keep_mask(self, x):
+        # per-sample stochastic depth mask, pre-scaled by 1 / keep_prob
+        keep_prob = 1.0 - self.drop_prob
+        mask = x.new_empty((x.shape[0], 1, 1, 1)).bernoulli_(keep_prob)
+        return mask.div_(keep_prob) if keep_prob > 0.0 else mask
+
+    def forward(self, x, keep_mask=None):
         input = x
         x = self.dwconv(x)
+        # channels_last input: both permutes are stride-only views, no copy
         x = x.permute(0, 2, 3, 1)  # (N, C, H, W) -> (N, H, W, C)
         x = self.norm(x)
         x = self.pwconv1(x)
         x = self.act(x)
         x = self.pwconv2(x)
-        if self.gamma is not None:
-            x = self.gamma * x
-        x = x.permute(0, 3, 1, 2)  # (N, H, W, C) -> (N, C, H, W)
 
-        x = input + self.drop_path(x)
-        return x
+        if keep_mask is None and self.training and self.drop_prob > 0.0:
+            keep_mask = self._keep_mask(x)
+        x = layer_scale_residual(input.permute(0, 2, 3, 1), x, self.gamma, keep_mask)
+        return x.permute(0, 3, 1, 2)  # (N, H, W, C) -> (N, C, H, W)
 
 
 class ConvNeXt(nn.Module):
@@ -74,6 +96,7 @@ class ConvNeXt(nn.Module):
         drop_path_rate (float): Stochastic depth rate. Default: 0.
         layer_scale_init_value (float): Init value for Layer Scale. Default: 1e-6.
         head_init_scale (float): Init scaling value for classifier weights and biases. Default: 1.
+        use_bf16 (bool): Run forward under bfloat16 autocast. Default: False
     """
 
     def __init__(
@@ -86,15 +109,17 @@ class ConvNeXt(nn.Module):
         layer_scale_init_value=1e-6,
         head_init_scale=1.0,
         act=nn.GELU,
+        use_bf16=False,
         **kwargs
     ):
         super().__init__()
+        self.use_bf16 = use_bf16
 
         self.downsample_layers = (
             nn.ModuleList()
         )  # stem and 3 intermediate downsampling conv layers
         stem = nn.Sequential(
-            nn.Conv2d(in_chans, dims[0], kernel_size=4, stride=4),
+            PatchifyConv2d(in_chans, dims[0], patch_size=4),
             LayerNorm(dims[0], eps=1e-6, data_format="channels_first"),
         )
         self.downsample_layers.append(stem)
@@ -108,22 +133,31 @@ class ConvNeXt(nn.Module):
         self.stages = (
             nn.ModuleList()
         )  # 4 feature resolution stages, each consisting of multiple residual blocks
-        dp_rates = [x.item() for x in torch.linspace(0, drop_path_rate, sum(depths))]
+        dp_rates = torch.linspace(0, drop_path_rate, sum(depths)).tolist()
         cur = 0
         for i in range(4):
-            stage = nn.Sequential(
-                *[
-                    Block(
-                        dim=dims[i],
-                        drop_path=dp_rates[cur + j],
-                        layer_scale_init_value=layer_scale_init_value,
-                        act=act,
-                    )
-                    for j in range(depths[i])
-                ]
-            )
+            stage = nn.ModuleList()
+            for j in range(depths[i]):
+                block = Block(
+                    dim=dims[i],
+                    drop_path=dp_rates[cur + j],
+                    layer_scale_init_value=layer_scale_init_value,
+                    act=act,
+                )
+                stage.append(block)
+                # an activation with nothing to train (e.g. the requires_grad=False
+                # ablations) is identical in every block: share the first block's
+                if not isinstance(act, nn.Module) and not any(
+                    p.requires_grad for p in block.act.parameters()
+                ):
+                    act = block.act
             self.stages.append(stage)
             cur += depths[i]
+        self.drop_path_rate = drop_path_rate
+        # plain attributes rather than buffers: DDP would broadcast a buffer on
+        # every forward, and .half() would round the rates
+        self.dp_rates = dp_rates
+        self._keep_prob_cache = {}
 
         self.norm = nn.LayerNorm(dims[-1], eps=1e-6)  # final norm layer
         self.head = nn.Linear(dims[-1], num_classes)
@@ -131,21 +165,89 @@ class ConvNeXt(nn.Module):
         self.apply(self._init_weights)
         self.head.weight.data.mul_(head_init_scale)
         self.head.bias.data.mul_(head_init_scale)
+        # NHWC conv kernels; only 4D conv weights are affected
+        self.to(memory_format=torch.channels_last)
 
     def _init_weights(self, m):
         if isinstance(m, (nn.Conv2d, nn.Linear)):
             trunc_normal_(m.weight, std=0.02)
             nn.init.constant_(m.bias, 0)
 
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        # blocks sharing one activation load every stages.i.j.act.* copy into the
+        # same tensor, so the checkpoint's copies must agree
+        shared_act = self.stages[0][0].act
+        keys = [
+            f"{prefix}stages.{i}.{j}.act."
+            for i, stage in enumerate(self.stages)
+            for j, block in enumerate(stage)
+            if block.act is shared_act
+        ]
+        for name in shared_act.state_dict():
+            values = [state_dict[k + name] for k in keys if k + name in state_dict]
+            assert all(
+                torch.equal(v, values[0]) for v in values
+            ), f"blocks share one activation but checkpoint values of act.{name} differ"
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
+    @torch.no_grad()
+    def fuse_for_inference(self):
+        """Fold the final norm's affine into the head (inference only).
+
+        head(norm(x)) with W' = W * norm.weight and b' = b + W @ norm.bias leaves
+        only the mean/rstd normalization online. The fused model no longer
+        matches the original state_dict layout. Calling it again is a no-op.
+        """
+        assert not self.training, "fuse_for_inference() requires model.eval()"
+        if not self.norm.elementwise_affine:
+            return self  # already fused
+        self.head.bias.add_(self.head.weight @ self.norm.bias)
+        self.head.weight.mul_(self.norm.weight)
+        self.norm = nn.LayerNorm(
+            self.norm.normalized_shape, eps=self.norm.eps, elementwise_affine=False
+        )
+        return self
+
+    def _keep_masks(self, x):
+        # stochastic depth masks of all blocks from a single RNG call, each
+        # (N, 1, 1, 1) and pre-scaled by 1 / keep_prob as in timm's DropPath
+        key = (x.device, x.dtype)
+        if key not in self._keep_prob_cache:
+            keep_prob = 1.0 - torch.tensor(self.dp_rates, dtype=torch.float64)
+            # like DropPath, leave the mask unscaled (all zeros) when keep_prob == 0
+            scale = (1.0 / keep_prob).masked_fill_(keep_prob <= 0.0, 0.0)
+            self._keep_prob_cache[key] = tuple(
+                t[:, None, None, None, None].to(device=x.device, dtype=x.dtype)
+                for t in (keep_prob, scale)
+            )
+        keep_prob, scale = self._keep_prob_cache[key]
+        masks = torch.rand(
+            (len(self.dp_rates), x.shape[0], 1, 1, 1), dtype=x.dtype, device=x.device
+        )
+        return masks.add_(keep_prob).floor_().mul_(scale)
+
     def forward_features(self, x):
+        x = x.contiguous(memory_format=torch.channels_last)
+        keep_masks = (
+            self._keep_masks(x) if self.training and self.drop_path_rate > 0.0 else None
+        )
+        cur = 0
         for i in range(4):
             x = self.downsample_layers[i](x)
-            x = self.stages[i](x)
+            for blk in self.stages[i]:
+                x = blk(x, None if keep_masks is None else keep_masks[cur])
+                cur += 1
         return self.norm(
-            x.mean([-2, -1])
+            F.adaptive_avg_pool2d(x, 1).flatten(1)
         )  # global average pooling, (N, C, H, W) -> (N, C)
 
     def forward(self, x):
+        if self.use_bf16:
+            # convs/linears run in bf16, autocast keeps layer_norm in fp32
+            with torch.autocast(device_type=x.device.type, dtype=torch.bfloat16):
+                x = self.forward_features(x)
+                x = self.head(x)
+            return x.float()
         x = self.forward_features(x)
         x = self.head(x)
         return x
@@ -174,11 +276,35 @@ class LayerNorm(nn.Module):
                 x, self.normalized_shape, self.weight, self.bias, self.eps
             )
         elif self.data_format == "channels_first":
-            u = x.mean(1, keepdim=True)
-            s = (x - u).pow(2).mean(1, keepdim=True)
-            x = (x - u) / torch.sqrt(s + self.eps)
-            x = self.weight[:, None, None] * x + self.bias[:, None, None]
-            return x
+            # normalize over channels with the fused kernel on a (N, H, W, C) view
+            x = x.permute(0, 2, 3, 1).contiguous(memory_format=torch.contiguous_format)
+            x = F.layer_norm(x, self.normalized_shape, self.weight, self.bias, self.eps)
+            return x.permute(0, 3, 1, 2)
+
+
+class PatchifyConv2d(nn.Conv2d):
+    r"""Non-overlapping patchify conv (kernel_size == stride) computed as one GEMM.
+    Patches and the conv weight are both flattened in (kh, kw, C) order: for a
+    channels_last weight the flatten is a view, while gathering the patches is a
+    single (im2col) copy. Parameters keep the nn.Conv2d layout, so checkpoints are
+    interchangeable with the equivalent nn.Conv2d.
+    """
+
+    def __init__(self, in_channels, out_channels, patch_size):
+        super().__init__(
+            in_channels, out_channels, kernel_size=patch_size, stride=patch_size
+        )
+
+    def forward(self, x):
+        N, C, H, W = x.shape
+        kh, kw = self.kernel_size
+        H, W = H // kh, W // kw
+        x = x[:, :, : H * kh, : W * kw]  # drop the remainder, as the conv does
+        x = x.permute(0, 2, 3, 1).reshape(N, H, kh, W, kw, C).permute(0, 1, 3, 2, 4, 5)
+        x = x.reshape(N, H, W, kh * kw * C)
+        weight = self.weight.permute(0, 2, 3, 1).reshape(self.out_channels, -1)
+        x = F.linear(x, weight, self.bias)
+        return x.permute(0, 3, 1, 2)  # (N, H, W, C) -> (N, C, H, W)
 
 
 model_urls = {
@@ -194,302 +320,91 @@ model_urls = {
 }
 
 
-@register_model
-def convnext_hermite_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(HermiteActivation, degree=3),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_hermite_small(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 27, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(HermiteActivation, degree=3),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_hermite_base(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 27, 3],
-        dims=[128, 256, 512, 1024],
-        act=partial(HermiteActivation, degree=3),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_fourier_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(FourierActivation, degree=5),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_fourier_small(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 27, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(FourierActivation, degree=5),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_fourier_base(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 27, 3],
-        dims=[128, 256, 512, 1024],
-        act=partial(FourierActivation, degree=5),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_tropical_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(TropicalActivation, degree=5),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_tropical_small(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 27, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(TropicalActivation, degree=5),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_tropical_base(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 27, 3],
-        dims=[128, 256, 512, 1024],
-        act=partial(TropicalActivation, degree=5),
-        **kwargs
-    )
-    return model
-
-
-### Ablation degree
-
-
-@register_model
-def convnext_hermite_deg2_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(HermiteActivation, degree=2),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_fourier_deg1_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(FourierActivation, degree=1),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_fourier_deg3_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(FourierActivation, degree=3),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_fourier_deg4_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(FourierActivation, degree=4),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_fourier_deg6_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(FourierActivation, degree=6),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_tropical_deg1_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(TropicalActivation, degree=1),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_tropical_deg3_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(TropicalActivation, degree=3),
-        **kwargs
-    )
-    return model
-
-
-### Ablation clamp
-
-
-@register_model
-def convnext_hermite_clamp_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(HermiteActivation, degree=3, clamp=True),
-        **kwargs
-    )
-    return model
-
-
-### Tropical rational
-
-
-@register_model
-def convnext_tropical_deg6_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(TropicalActivation, degree=6),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_tropical_deg9_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(TropicalActivation, degree=9),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_tropical_deg12_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(TropicalActivation, degree=12),
-        **kwargs
-    )
-    return model
-
-
-### Ablation init from GELU
-
-
-@register_model
-def convnext_hermite_gelu_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(HermiteActivation, degree=3, act_init=nn.GELU()),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_fourier_deg6_gelu_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(FourierActivation, degree=6, act_init=nn.GELU()),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_tropical_deg12_gelu_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(TropicalActivation, degree=12, act_init=nn.GELU()),
-        **kwargs
-    )
-    return model
-
-
-### Ablation requires_grad
-
-
-@register_model
-def convnext_hermite_no_grad_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(HermiteActivation, degree=3, requires_grad=False),
-        **kwargs
-    )
-    return model
-
-
-@register_model
-def convnext_fourier_deg6_no_grad_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(FourierActivation, degree=6, requires_grad=False),
-        **kwargs
-    )
-    return model
-
+_sizes = {
+    "tiny": dict(depths=[3, 3, 9, 3], dims=[96, 192, 384, 768]),
+    "small": dict(depths=[3, 3, 27, 3], dims=[96, 192, 384, 768]),
+    "base": dict(depths=[3, 3, 27, 3], dims=[128, 256, 512, 1024]),
+}
 
-@register_model
-def convnext_tropical_deg12_no_grad_tiny(pretrained=False, in_22k=False, **kwargs):
-    model = ConvNeXt(
-        depths=[3, 3, 9, 3],
-        dims=[96, 192, 384, 768],
-        act=partial(TropicalActivation, degree=12, requires_grad=False),
-        **kwargs
-    )
-    return model
+# (model name, size, activation factory)
+_variants = [
+    ("convnext_hermite_tiny", "tiny", partial(HermiteActivation, degree=3)),
+    ("convnext_hermite_small", "small", partial(HermiteActivation, degree=3)),
+    ("convnext_hermite_base", "base", partial(HermiteActivation, degree=3)),
+    ("convnext_fourier_tiny", "tiny", partial(FourierActivation, degree=5)),
+    ("convnext_fourier_small", "small", partial(FourierActivation, degree=5)),
+    ("convnext_fourier_base", "base", partial(FourierActivation, degree=5)),
+    ("convnext_tropical_tiny", "tiny", partial(TropicalActivation, degree=5)),
+    ("convnext_tropical_small", "small", partial(TropicalActivation, degree=5)),
+    ("convnext_tropical_base", "base", partial(TropicalActivation, degree=5)),
+
+    # Ablation degree
+    ("convnext_hermite_deg2_tiny", "tiny", partial(HermiteActivation, degree=2)),
+    ("convnext_fourier_deg1_tiny", "tiny", partial(FourierActivation, degree=1)),
+    ("convnext_fourier_deg3_tiny", "tiny", partial(FourierActivation, degree=3)),
+    ("convnext_fourier_deg4_tiny", "tiny", partial(FourierActivation, degree=4)),
+    ("convnext_fourier_deg6_tiny", "tiny", partial(FourierActivation, degree=6)),
+    ("convnext_tropical_deg1_tiny", "tiny", partial(TropicalActivation, degree=1)),
+    ("convnext_tropical_deg3_tiny", "tiny", partial(TropicalActivation, degree=3)),
+
+    # Ablation clamp
+    (
+        "convnext_hermite_clamp_tiny",
+        "tiny",
+        partial(HermiteActivation, degree=3, clamp=True),
+    ),
+
+    # Tropical rational
+    ("convnext_tropical_deg6_tiny", "tiny", partial(TropicalActivation, degree=6)),
+    ("convnext_tropical_deg9_tiny", "tiny", partial(TropicalActivation, degree=9)),
+    ("convnext_tropical_deg12_tiny", "tiny", partial(TropicalActivation, degree=12)),
+
+    # Ablation init from GELU
+    (
+        "convnext_hermite_gelu_tiny",
+        "tiny",
+        partial(HermiteActivation, degree=3, act_init=nn.GELU()),
+    ),
+    (
+        "convnext_fourier_deg6_gelu_tiny",
+        "tiny",
+        partial(FourierActivation, degree=6, act_init=nn.GELU()),
+    ),
+    (
+        "convnext_tropical_deg12_gelu_tiny",
+        "tiny",
+        partial(TropicalActivation, degree=12, act_init=nn.GELU()),
+    ),
+
+    # Ablation requires_grad
+    (
+        "convnext_hermite_no_grad_tiny",
+        "tiny",
+        partial(HermiteActivation, degree=3, requires_grad=False),
+    ),
+    (
+        "convnext_fourier_deg6_no_grad_tiny",
+        "tiny",
+        partial(FourierActivation, degree=6, requires_grad=False),
+    ),
+    (
+        "convnext_tropical_deg12_no_grad_tiny",
+        "tiny",
+        partial(TropicalActivation, degree=12, requires_grad=False),
+    ),
+]
+
+
+def _register_variant(name, size, act):
+    def model_fn(pretrained=False, in_22k=False, **kwargs):
+        model = ConvNeXt(act=act, **_sizes[size], **kwargs)
+        return model
+
+    # timm's registry keys entries on the function's name and module
+    model_fn.__name__ = model_fn.__qualname__ = name
+    model_fn.__module__ = __name__
+    globals()[name] = register_model(model_fn)
+
+
+for _name, _size, _act in _variants:
+    _register_variant(_name, _size, _act)
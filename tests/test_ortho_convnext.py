@@ -0,0 +1,99 @@
+from functools import partial
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("timm")
+pytest.importorskip("torchortho")
+
+import torch.nn as nn
+import torch.nn.functional as F
+
+from torchortho import HermiteActivation, FourierActivation, TropicalActivation
+
+from models.ortho_convnext import ConvNeXt, PatchifyConv2d
+
+
+@pytest.mark.parametrize("size", [(224, 224), (30, 37), (33, 35)])
+@pytest.mark.parametrize("channels_last", [False, True])
+def test_patchify_conv2d_matches_conv2d(size, channels_last):
+    torch.manual_seed(0)
+    conv = nn.Conv2d(3, 16, kernel_size=4, stride=4)
+    patchify = PatchifyConv2d(3, 16, patch_size=4)
+    # checkpoints are interchangeable with nn.Conv2d
+    patchify.load_state_dict(conv.state_dict())
+    x = torch.randn(2, 3, *size)
+    if channels_last:
+        patchify.to(memory_format=torch.channels_last)
+        x = x.contiguous(memory_format=torch.channels_last)
+
+    out = patchify(x)
+    ref = F.conv2d(x, conv.weight, conv.bias, stride=4)
+    assert out.shape == ref.shape
+    assert torch.allclose(out, ref, rtol=1e-4, atol=1e-5)
+
+
+class FrozenScale(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.scale = nn.Parameter(torch.ones(1), requires_grad=False)
+
+    def forward(self, x):
+        return self.scale * x
+
+
+@pytest.mark.parametrize(
+    "act",
+    [
+        partial(HermiteActivation, degree=3, requires_grad=False),
+        partial(FourierActivation, degree=6, requires_grad=False),
+        partial(TropicalActivation, degree=12, requires_grad=False),
+    ],
+)
+def test_frozen_ortho_activations_are_deterministic(act):
+    # the *_no_grad_* variants share one instance across blocks, which is only
+    # equivalent to per-block instances if construction is deterministic
+    torch.manual_seed(0)
+    first = act().state_dict()
+    torch.manual_seed(1)
+    second = act().state_dict()
+    assert first.keys() == second.keys()
+    for k in first:
+        assert torch.equal(first[k], second[k]), k
+
+
+def test_frozen_activation_is_shared_across_blocks():
+    model = ConvNeXt(depths=[1, 1, 2, 1], dims=[8, 16, 32, 64], act=FrozenScale)
+    acts = {id(block.act) for stage in model.stages for block in stage}
+    assert len(acts) == 1
+
+    state_dict = model.state_dict()
+    model.load_state_dict(state_dict)
+    state_dict["stages.2.1.act.scale"] = torch.full((1,), 2.0)
+    with pytest.raises(AssertionError):
+        model.load_state_dict(state_dict)
+
+
+def test_fuse_for_inference_preserves_output():
+    torch.manual_seed(0)
+    model = ConvNeXt(depths=[1, 1, 1, 1], dims=[8, 16, 32, 64], num_classes=10)
+    with torch.no_grad():
+        # non-trivial affine, ones/zeros would hide a wrong fusion order
+        model.norm.weight.uniform_(0.5, 1.5)
+        model.norm.bias.normal_()
+    model.eval()
+    x = torch.randn(2, 3, 64, 64)
+    with torch.no_grad():
+        ref = model(x)
+        out = model.fuse_for_inference()(x)
+        assert torch.allclose(out, ref, rtol=1e-4, atol=1e-5)
+
+        head = {k: v.clone() for k, v in model.head.state_dict().items()}
+        model.fuse_for_inference()
+        for k, v in model.head.state_dict().items():
+            assert torch.equal(v, head[k])
+        assert torch.allclose(model(x), ref, rtol=1e-4, atol=1e-5)
+
+    model.train()
+    with pytest.raises(AssertionError):
+        model.fuse_for_inference()